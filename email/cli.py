@@ -4,31 +4,106 @@ command-line tool to download and convert Gmail emails to markdown
 """
 
 import os
-import json
-import base64
 import re
+import time
+import random
+import hashlib
 import subprocess
 import argparse
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from email.utils import parsedate_to_datetime
+from functools import partial
 from pathlib import Path
 import pickle
+import orjson
 from googleapiclient.discovery import build
+from googleapiclient.errors import HttpError
+from googleapiclient.model import JsonModel
 from google_auth_oauthlib.flow import InstalledAppFlow
 from google.auth.transport.requests import Request
+from google.oauth2.credentials import Credentials
+
+# pybase64 is a drop-in, SIMD-accelerated replacement for the stdlib codec
+try:
+    import pybase64 as base64
+except ImportError:
+    import base64
 
 from convert import convert
 
 # Gmail API scopes
 SCOPES = ['https://www.googleapis.com/auth/gmail.readonly']
 
+# Maximum number of calls Gmail accepts in a single batch request
+GMAIL_BATCH_LIMIT = 100
+
+# Number of batch requests in flight at once; keeps us under Gmail's
+# per-user concurrent request quota
+DEFAULT_DOWNLOAD_WORKERS = 5
+
+# Batch sub-requests ignore num_retries, so calls rejected for rate limiting or
+# server errors are re-sent in a follow-up batch, up to this many times
+MAX_BATCH_RETRIES = 5
+
+# Partial-response mask for messages.get: only the fields process_email_for_storage
+# keeps, with the MIME tree reduced to part types, filenames and bodies. Gmail's
+# fields syntax has no recursion, so nesting is spelled out to MESSAGE_PART_DEPTH
+# levels.
+MESSAGE_PART_DEPTH = 5
+
+def _message_fields(depth=MESSAGE_PART_DEPTH):
+    part_fields = 'mimeType,filename,body(data,attachmentId)'
+    fields = part_fields
+    for _ in range(depth):
+        fields = f'{part_fields},parts({fields})'
+    return f'id,threadId,labelIds,snippet,payload(headers,{fields})'
+
+MESSAGE_FIELDS = _message_fields()
+
+def _mask_truncated(payload, depth=MESSAGE_PART_DEPTH):
+    """Return True if the fields mask cut off a multipart part at its deepest level"""
+    stack = [(payload, 0)]
+    while stack:
+        part, level = stack.pop()
+        if level == depth:
+            # The mask drops parts here, so a container has lost its children
+            if part.get('mimeType', '').startswith(('multipart/', 'message/')):
+                return True
+        else:
+            stack.extend((child, level + 1) for child in part.get('parts', []))
+    return False
+
+# Number of emails converted concurrently; bounded by the LLM's rate limits
+DEFAULT_CONVERT_WORKERS = 8
+
+# Cache of converted essays keyed by sha256 of the email body, kept in the
+# markdown output directory so re-runs skip the LLM for known emails
+CONVERT_CACHE_FILENAME = '.convert_cache.json'
+
+# Gmail message ID -> markdown filename written for it, so emails whose output
+# already exists are skipped before they are read or converted
+CONVERT_OUTPUTS_FILENAME = '.convert_outputs.json'
+
+# Characters not allowed in markdown filenames, and whitespace runs to collapse
+_TITLE_STRIP_RE = re.compile(r'[<>:"/\\|?*]')
+_WS_RE = re.compile(r'\s+')
+
 def setup_gmail_api():
-    """Set up Gmail API authentication"""
+    """Set up Gmail API authentication and return OAuth credentials"""
     creds = None
 
     # Check for existing token
-    if os.path.exists('token.pickle'):
+    if os.path.exists('token.json'):
+        creds = Credentials.from_authorized_user_file('token.json', SCOPES)
+    elif os.path.exists('token.pickle'):
+        # One-time migration from the old pickled token to token.json
         with open('token.pickle', 'rb') as token:
             creds = pickle.load(token)
+        with open('token.json', 'w') as token:
+            token.write(creds.to_json())
+        os.remove('token.pickle')
 
     # If no valid credentials, get new ones
     if not creds or not creds.valid:
@@ -50,10 +125,38 @@ def setup_gmail_api():
             creds = flow.run_local_server(port=0)
 
         # Save credentials for next run
-        with open('token.pickle', 'wb') as token:
-            pickle.dump(creds, token)
+        with open('token.json', 'w') as token:
+            token.write(creds.to_json())
+
+    return creds
 
-    return build('gmail', 'v1', credentials=creds)
+def _is_retryable(exception):
+    """Return True for rate-limit (429) and server (5xx) errors worth retrying"""
+    if not isinstance(exception, HttpError):
+        return False
+    return exception.resp.status == 429 or exception.resp.status >= 500
+
+class FastJsonModel(JsonModel):
+    """JsonModel that parses API responses with orjson instead of json.loads"""
+
+    def deserialize(self, content):
+        try:
+            body = orjson.loads(content)
+        except orjson.JSONDecodeError:
+            # Like JsonModel, hand back non-JSON bodies as text instead of
+            # raising, which would abort the rest of a batch's callbacks
+            return content.decode('utf-8') if isinstance(content, bytes) else content
+        if self._data_wrapper and 'data' in body:
+            body = body['data']
+        return body
+
+def build_gmail_service(creds):
+    """Build a Gmail API service object.
+
+    The underlying httplib2 connection is not thread-safe, so each worker
+    thread must build its own service from the shared credentials.
+    """
+    return build('gmail', 'v1', credentials=creds, model=FastJsonModel())
 
 def build_gmail_query(args):
     """Build Gmail query string from command line arguments"""
@@ -142,8 +245,12 @@ def get_message_ids(service, args):
     print(f"Total emails found: {len(message_ids)}")
     return message_ids
 
+def _headers_dict(payload):
+    """Build a name -> value dict from a Gmail payload's header list"""
+    return {h['name']: h['value'] for h in payload.get('headers', ())}
+
 def process_email_for_storage(message):
-    """Process email message and decode Base64 content"""
+    """Process email message, keeping body parts as raw base64 for lazy decoding"""
     processed = {
         'id': message.get('id', ''),
         'threadId': message.get('threadId', ''),
@@ -151,29 +258,32 @@ def process_email_for_storage(message):
         'snippet': message.get('snippet', ''),
         'headers': {},
         'body': {
-            'text': '',
-            'html': ''
+            'text_b64': '',
+            'html_b64': ''
         }
     }
 
-    # Extract headers
-    if 'payload' in message and 'headers' in message['payload']:
-        for header in message['payload']['headers']:
-            processed['headers'][header['name']] = header['value']
-
-    # Extract and decode body content
     if 'payload' in message:
-        text_content = extract_content_from_payload(message['payload'], 'text/plain')
-        html_content = extract_content_from_payload(message['payload'], 'text/html')
+        # Extract headers
+        processed['headers'] = _headers_dict(message['payload'])
+
+        # Extract body content, decoded only when it is actually converted
+        text_data, html_data = find_text_and_html_data(message['payload'])
 
-        processed['body']['text'] = text_content
-        processed['body']['html'] = html_content
+        processed['body']['text_b64'] = text_data
+        processed['body']['html_b64'] = html_data
 
     return processed
 
-def download_email_batch(service, message_ids, output_dir, batch_size=50, dry_run=False):
-    """Download emails in batches and save as JSON with decoded content"""
+def download_email_batch(creds, message_ids, output_dir, batch_size=50, dry_run=False,
+                         max_workers=DEFAULT_DOWNLOAD_WORKERS, full=False):
+    """Download emails in batches and save as JSON
+
+    Unless full is set, Gmail is asked for a partial response holding only the
+    fields that are stored.
+    """
     if dry_run:
+        service = build_gmail_service(creds)
         print(f"\n[DRY RUN] Would download {len(message_ids)} emails")
         # Show first few email subjects as preview
         preview_count = min(5, len(message_ids))
@@ -187,7 +297,7 @@ def download_email_batch(service, message_ids, output_dir, batch_size=50, dry_ru
                     metadataHeaders=['Subject', 'From', 'Date']
                 ).execute()
 
-                headers = {h['name']: h['value'] for h in message['payload'].get('headers', [])}
+                headers = _headers_dict(message['payload'])
                 print(f"  {i+1}. {headers.get('Subject', 'No Subject')}")
                 print(f"     From: {headers.get('From', 'Unknown')}")
                 print(f"     Date: {headers.get('Date', 'Unknown')}")
@@ -204,47 +314,173 @@ def download_email_batch(service, message_ids, output_dir, batch_size=50, dry_ru
     raw_emails_dir = output_dir / "raw_emails"
     raw_emails_dir.mkdir(exist_ok=True)
 
-    print(f"Downloading {len(message_ids)} emails in batches of {batch_size}...")
+    # Gmail rejects batch requests with more than GMAIL_BATCH_LIMIT calls
+    batch_size = max(1, min(batch_size, GMAIL_BATCH_LIMIT))
 
-    for i in range(0, len(message_ids), batch_size):
-        batch = message_ids[i:i+batch_size]
-        print(f"Processing batch {i//batch_size + 1}/{(len(message_ids)-1)//batch_size + 1}")
+    # Skip already-downloaded emails with one directory scan instead of a stat per ID
+    downloaded = {
+        entry.name[:-5] for entry in os.scandir(raw_emails_dir)
+        if entry.name.endswith('.json')
+    }
+    skipped = sum(1 for msg_id in message_ids if msg_id in downloaded)
+    message_ids = [msg_id for msg_id in message_ids if msg_id not in downloaded]
 
-        for j, msg_id in enumerate(batch):
-            try:
-                # Check if already downloaded
-                email_file = raw_emails_dir / f"{msg_id}.json"
-                if email_file.exists():
-                    print(f"  Skipping {msg_id} (already downloaded)")
-                    continue
+    if skipped:
+        print(f"Skipping {skipped} emails (already downloaded)")
+    if not message_ids:
+        return
 
-                # Download email
-                message = service.users().messages().get(
-                    userId='me',
-                    id=msg_id,
-                    format='full'
-                ).execute()
+    print(f"Downloading {len(message_ids)} emails in batches of {batch_size}...")
 
-                # Process and decode content
-                processed_message = process_email_for_storage(message)
+    def save_message(msg_id, message):
+        """Process a single message and save it as JSON"""
+        try:
+            processed_message = process_email_for_storage(message)
+            email_file = raw_emails_dir / f"{msg_id}.json"
+            email_file.write_bytes(orjson.dumps(processed_message))
+            print(f"  Downloaded: {msg_id}")
+        except Exception as e:
+            print(f"  Error saving {msg_id}: {e}")
+
+    thread_local = threading.local()
+
+    def get_service():
+        """Return this worker thread's Gmail service, building it on first use"""
+        if not hasattr(thread_local, 'service'):
+            thread_local.service = build_gmail_service(creds)
+        return thread_local.service
+
+    def download_batch(batch_ids):
+        """Fetch one slice of message IDs in a single multipart HTTP batch request
+
+        Rate-limited calls are retried with exponential backoff, messages the
+        fields mask truncated are refetched in full, and text bodies Gmail
+        returned as attachments are fetched together in a follow-up batch.
+        """
+        service = get_service()
+        truncated = []
+        # Message ID -> (message, text part whose body is an attachment)
+        pending = {}
+        # Message ID -> error of calls to re-send in the next attempt
+        throttled = {}
+
+        def on_message(request_id, response, exception, masked=not full):
+            """Batch callback: save a messages.get response or queue its follow-up"""
+            if exception is not None:
+                if _is_retryable(exception):
+                    throttled[request_id] = exception
+                else:
+                    print(f"  Error downloading {request_id}: {exception}")
+                return
 
-                # Save processed JSON with decoded content
-                with open(email_file, 'w', encoding='utf-8') as f:
-                    json.dump(processed_message, f, indent=2, ensure_ascii=False)
+            try:
+                payload = response.get('payload', {})
+                if masked and _mask_truncated(payload):
+                    print(f"  Warning: {request_id} nests MIME parts deeper than "
+                          f"{MESSAGE_PART_DEPTH} levels, refetching without the fields mask")
+                    truncated.append(request_id)
+                    return
+
+                text_part, _ = find_text_and_html_parts(payload)
+                if text_part and not text_part['body'].get('data'):
+                    pending[request_id] = (response, text_part)
+                    return
+            except Exception as e:
+                print(f"  Error processing {request_id}: {e}")
+                return
+
+            save_message(request_id, response)
 
-                print(f"  Downloaded {j+1}/{len(batch)}: {msg_id}")
+        def on_attachment(request_id, response, exception):
+            """Batch callback: fill in a deferred text body and save its message"""
+            if exception is not None:
+                if _is_retryable(exception):
+                    throttled[request_id] = exception
+                else:
+                    print(f"  Error downloading text body of {request_id}: {exception}")
+                return
 
+            try:
+                message, text_part = pending[request_id]
+                text_part['body']['data'] = response['data']
             except Exception as e:
-                print(f"  Error downloading {msg_id}: {e}")
-                continue
+                print(f"  Error processing text body of {request_id}: {e}")
+                return
+
+            save_message(request_id, message)
+
+        def run_batch(msg_ids, make_request, callback):
+            """Execute one call per message ID as a batch, retrying throttled calls"""
+            for attempt in range(MAX_BATCH_RETRIES + 1):
+                if attempt:
+                    # Exponential backoff with jitter: ~2s, 4s, 8s, ...
+                    time.sleep(2 ** attempt + random.random())
+                throttled.clear()
+
+                batch = service.new_batch_http_request(callback=callback)
+                for msg_id in msg_ids:
+                    batch.add(make_request(msg_id), request_id=msg_id)
+                batch.execute()
+
+                if not throttled:
+                    return
+                msg_ids = list(throttled)
+
+            for msg_id, exception in throttled.items():
+                print(f"  Error downloading {msg_id} after {MAX_BATCH_RETRIES} retries: {exception}")
+
+        def get_message(msg_id):
+            params = {'userId': 'me', 'id': msg_id, 'format': 'full'}
+            if not full:
+                params['fields'] = MESSAGE_FIELDS
+            return service.users().messages().get(**params)
+
+        run_batch(batch_ids, get_message, on_message)
+
+        if truncated:
+            run_batch(
+                truncated,
+                lambda msg_id: service.users().messages().get(userId='me', id=msg_id, format='full'),
+                partial(on_message, masked=False)
+            )
+
+        if pending:
+            run_batch(
+                list(pending),
+                lambda msg_id: service.users().messages().attachments().get(
+                    userId='me',
+                    messageId=msg_id,
+                    id=pending[msg_id][1]['body']['attachmentId'],
+                    fields='data'
+                ),
+                on_attachment
+            )
+
+    total_batches = (len(message_ids) - 1) // batch_size + 1
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        futures = {
+            executor.submit(download_batch, message_ids[i:i+batch_size]): i // batch_size + 1
+            for i in range(0, len(message_ids), batch_size)
+        }
+
+        try:
+            for future in as_completed(futures):
+                batch_num = futures[future]
+                try:
+                    future.result()
+                    print(f"Finished batch {batch_num}/{total_batches}")
+                except Exception as e:
+                    print(f"  Error executing batch {batch_num}/{total_batches}: {e}")
+        except BaseException:
+            # On Ctrl-C, drop queued batches instead of downloading them all
+            executor.shutdown(wait=True, cancel_futures=True)
+            raise
 
 def extract_email_content(message_data):
     """Extract readable content from Gmail message"""
     # Get headers
-    headers = {}
-    if 'payload' in message_data and 'headers' in message_data['payload']:
-        for header in message_data['payload']['headers']:
-            headers[header['name']] = header['value']
+    headers = _headers_dict(message_data.get('payload', {}))
 
     subject = headers.get('Subject', 'No Subject')
     date_str = headers.get('Date', '')
@@ -252,12 +488,9 @@ def extract_email_content(message_data):
 
     # Parse date
     try:
-        date_obj = datetime.strptime(date_str.split(' (')[0], '%a, %d %b %Y %H:%M:%S %z')
-    except:
-        try:
-            date_obj = datetime.strptime(date_str.split(',')[1].strip().split(' +')[0], '%d %b %Y %H:%M:%S')
-        except:
-            date_obj = datetime.now()
+        date_obj = parsedate_to_datetime(date_str)
+    except (TypeError, ValueError):
+        date_obj = datetime.now()
 
     # Extract content
     content = extract_content_from_payload(message_data['payload'])
@@ -270,85 +503,189 @@ def extract_email_content(message_data):
         'message_id': message_data.get('id', '')
     }
 
+def find_text_and_html_parts(payload):
+    """Walk the MIME tree once and return the first text/plain and text/html leaf parts"""
+    text_part = None
+    html_part = None
+
+    # Explicit stack in document order instead of recursion
+    stack = [payload]
+    while stack and not (text_part and html_part):
+        part = stack.pop()
+
+        if 'parts' in part:
+            stack.extend(reversed(part['parts']))
+            continue
+
+        # File attachments carry a filename; they are never the email body
+        if part.get('filename'):
+            continue
+
+        # Large bodies come back as an attachmentId instead of inline data
+        body = part.get('body', {})
+        if not (body.get('data') or body.get('attachmentId')):
+            continue
+
+        if part['mimeType'] == 'text/plain' and text_part is None:
+            text_part = part
+        elif part['mimeType'] == 'text/html' and html_part is None:
+            html_part = part
+
+    return text_part, html_part
+
+def find_text_and_html_data(payload):
+    """Return the first raw base64 (text, html) bodies from the MIME tree"""
+    text_part, html_part = find_text_and_html_parts(payload)
+    text_data = text_part['body'].get('data', '') if text_part else ''
+    html_data = html_part['body'].get('data', '') if html_part else ''
+    return text_data, html_data
+
+def decode_body_data(data):
+    """Decode a Gmail base64url body part to text"""
+    if not data:
+        return ""
+    return base64.urlsafe_b64decode(data).decode('utf-8')
+
+def extract_text_and_html(payload):
+    """Return the first decoded (text, html) bodies from the MIME tree"""
+    text_data, html_data = find_text_and_html_data(payload)
+    return decode_body_data(text_data), decode_body_data(html_data)
+
 def extract_content_from_payload(payload, mime_type_filter=None):
-    """Recursively extract and decode content from email payload"""
-    content = ""
-
-    if 'parts' in payload:
-        for part in payload['parts']:
-            if mime_type_filter and part['mimeType'] == mime_type_filter:
-                if 'data' in part['body']:
-                    content = base64.urlsafe_b64decode(part['body']['data']).decode('utf-8')
-                    break
-            elif not mime_type_filter:
-                if part['mimeType'] == 'text/html':
-                    if 'data' in part['body']:
-                        content = base64.urlsafe_b64decode(part['body']['data']).decode('utf-8')
-                        break
-                elif part['mimeType'] == 'text/plain':
-                    if 'data' in part['body'] and not content:
-                        content = base64.urlsafe_b64decode(part['body']['data']).decode('utf-8')
-
-            if 'parts' in part:
-                content = extract_content_from_payload(part, mime_type_filter)
-                if content:
-                    break
-    elif payload['mimeType'] in ['text/html', 'text/plain']:
-        if not mime_type_filter or payload['mimeType'] == mime_type_filter:
-            if 'data' in payload['body']:
-                content = base64.urlsafe_b64decode(payload['body']['data']).decode('utf-8')
-
-    return content
-
-def convert_emails_to_markdown(raw_emails_dir, output_dir):
+    """Extract decoded content from email payload, preferring HTML when no filter is given"""
+    text, html = extract_text_and_html(payload)
+
+    if mime_type_filter == 'text/plain':
+        return text
+    if mime_type_filter == 'text/html':
+        return html
+    if mime_type_filter:
+        return ""
+    return html or text
+
+def _markdown_filename(title, date):
+    """Build the markdown filename for a converted essay"""
+    date_str = date.strftime('%-d %b %y')
+    clean_title = _TITLE_STRIP_RE.sub('', title)
+    clean_title = _WS_RE.sub(' ', clean_title).strip()[:150]
+    return f"{date_str} {clean_title}.md"
+
+def _load_convert_cache(cache_file):
+    """Load a JSON dict cache from the output directory, or an empty one"""
+    if not cache_file.exists():
+        return {}
+    try:
+        return orjson.loads(cache_file.read_bytes())
+    except orjson.JSONDecodeError as e:
+        print(f"Warning: ignoring unreadable cache {cache_file}: {e}")
+        return {}
+
+def _convert_one(json_file, output_dir, cache, outputs, existing_md):
+    """Convert a single downloaded JSON email to markdown.
+
+    The LLM is only called for bodies whose sha256 is not already in cache.
+    The markdown filename is recorded in outputs under the message ID.
+    Returns (ok, name, err): name is the markdown filename written, or None
+    if the output already existed; err is set when ok is False.
+    """
+    try:
+        message_data = orjson.loads(json_file.read_bytes())
 
-    """Convert downloaded JSON emails to markdown"""
-    raw_emails_dir = Path(raw_emails_dir)
-    output_dir = Path(output_dir)
+        body = message_data['body']
+        if 'text_b64' in body:
+            content = decode_body_data(body['text_b64'])
+        else:
+            # Emails downloaded before bodies were stored as raw base64
+            content = body.get('text',None)
+
+        key = hashlib.sha256(content.encode('utf-8')).hexdigest()
+        entry = cache.get(key)
+        if entry is None:
+            essay = convert(content)
+            entry = {
+                'title': essay.PostTitle,
+                'date': essay.Date.isoformat(),
+                'content': essay.Content
+            }
+            cache[key] = entry
 
-    print("Converting emails to markdown...")
+        # Create markdown filename using essay date
+        md_filename = _markdown_filename(entry['title'], datetime.fromisoformat(entry['date']))
+        outputs[json_file.stem] = md_filename
 
-    json_files = list(raw_emails_dir.glob("*.json"))
-    print(f"Found {len(json_files)} email files to convert")
+        # Skip if exists
+        if md_filename in existing_md:
+            return True, None, None
+        existing_md.add(md_filename)
 
-    successful = 0
-    failed = 0
+        # Write the markdown directly
+        with open(output_dir / md_filename, 'w', encoding='utf-8') as f:
+            f.write(entry['content'])
 
-    for json_file in json_files:
-        try:
-            with open(json_file, 'r', encoding='utf-8') as f:
-                message_data = json.load(f)
+        return True, md_filename, None
 
-            content = message_data['body'].get('text',None)
+    except Exception as e:
+        return False, json_file.name, e
 
-            try:
-                essay = convert(content)
+def convert_emails_to_markdown(raw_emails_dir, output_dir, max_workers=DEFAULT_CONVERT_WORKERS):
 
-                # Create markdown filename using essay date
-                date_str = essay.Date.strftime('%-d %b %y')
-                clean_title = re.sub(r'[<>:"/\\|?*/?]', '', essay.PostTitle)
-                clean_title = re.sub(r'\s+', ' ', clean_title).strip()[:150]
-                md_filename = f"{date_str} {clean_title}.md"
-                md_file = output_dir / md_filename
+    """Convert downloaded JSON emails to markdown"""
+    raw_emails_dir = Path(raw_emails_dir)
+    output_dir = Path(output_dir)
 
-                # Skip if exists
-                if md_file.exists():
-                    continue
+    print("Converting emails to markdown...")
 
-                # Write the markdown directly
-                with open(md_file, 'w', encoding='utf-8') as f:
-                    f.write(essay.Content)
+    json_files = [
+        Path(entry.path) for entry in os.scandir(raw_emails_dir)
+        if entry.name.endswith('.json') and entry.is_file()
+    ]
+    print(f"Found {len(json_files)} email files")
 
-            except Exception as convert_error:
-                print(f"  Skipping {json_file.name} (conversion failed): {convert_error}")
-                continue
+    output_dir.mkdir(parents=True, exist_ok=True)
+    cache_file = output_dir / CONVERT_CACHE_FILENAME
+    cache = _load_convert_cache(cache_file)
+    outputs_file = output_dir / CONVERT_OUTPUTS_FILENAME
+    outputs = _load_convert_cache(outputs_file)
+
+    # Skip emails whose markdown was written by an earlier run and still exists
+    existing_md = {
+        entry.name for entry in os.scandir(output_dir)
+        if entry.name.endswith('.md')
+    }
+    json_files = [
+        json_file for json_file in json_files
+        if outputs.get(json_file.stem) not in existing_md
+    ]
+    print(f"{len(json_files)} email files to convert")
 
-            print(f"  ✓ Converted: {md_filename}")
-            successful += 1
+    successful = 0
+    failed = 0
 
-        except Exception as e:
-            print(f"  ✗ Error converting {json_file.name}: {e}")
-            failed += 1
+    try:
+        # Conversion is dominated by waiting on the LLM, so run files concurrently
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            futures = [
+                executor.submit(_convert_one, json_file, output_dir, cache, outputs, existing_md)
+                for json_file in json_files
+            ]
+
+            try:
+                for future in as_completed(futures):
+                    ok, name, err = future.result()
+                    if not ok:
+                        print(f"  ✗ Error converting {name}: {err}")
+                        failed += 1
+                    elif name:
+                        print(f"  ✓ Converted: {name}")
+                        successful += 1
+            except BaseException:
+                # On Ctrl-C, drop queued emails instead of converting them all
+                executor.shutdown(wait=True, cancel_futures=True)
+                raise
+    finally:
+        # Persist LLM results even if the run is interrupted
+        cache_file.write_bytes(orjson.dumps(cache))
+        outputs_file.write_bytes(orjson.dumps(outputs))
 
     print(f"\nConversion complete! Success: {successful}, Failed: {failed}")
 
@@ -407,8 +744,16 @@ Examples:
     # Processing options for download
     download_parser.add_argument('--max-results', '-m', type=int,
                         help='Maximum number of emails to download')
-    download_parser.add_argument('--batch-size', type=int, default=50,
-                        help='Batch size for downloading (default: 50)')
+    download_parser.add_argument('--batch-size', type=int,
+                        default=int(os.getenv('GMAIL_BATCH_SIZE', 50)),
+                        help='Messages per Gmail batch request, max 100 '
+                             '(default: $GMAIL_BATCH_SIZE or 50)')
+    download_parser.add_argument('--workers', '-w', type=int,
+                        default=DEFAULT_DOWNLOAD_WORKERS,
+                        help=f'Number of batch requests to run concurrently '
+                             f'(default: {DEFAULT_DOWNLOAD_WORKERS})')
+    download_parser.add_argument('--full', action='store_true',
+                        help='Fetch complete Gmail message resources instead of only stored fields')
     download_parser.add_argument('--dry-run', '-n', action='store_true',
                         help='Preview what would be downloaded without actually downloading')
     download_parser.add_argument('--force', '-f', action='store_true',
@@ -435,6 +780,10 @@ Examples:
     convert_parser.add_argument('--output', '-o',
                         default='~/Documents/gmail_exports',
                         help='Output directory for markdown files (default: ~/Documents/gmail_exports)')
+    convert_parser.add_argument('--workers', '-w', type=int,
+                        default=DEFAULT_CONVERT_WORKERS,
+                        help=f'Number of emails to convert concurrently '
+                             f'(default: {DEFAULT_CONVERT_WORKERS})')
 
     args = parser.parse_args()
 
@@ -464,9 +813,10 @@ def main():
         output_dir = os.path.expanduser(args.output)
 
         # Setup Gmail API
-        service = setup_gmail_api()
-        if not service:
+        creds = setup_gmail_api()
+        if not creds:
             return
+        service = build_gmail_service(creds)
 
         print("✓ Gmail API authenticated")
 
@@ -477,9 +827,11 @@ def main():
             return
 
         # Download emails as JSON
-        download_email_batch(service, message_ids, output_dir,
+        download_email_batch(creds, message_ids, output_dir,
                             batch_size=args.batch_size,
-                            dry_run=args.dry_run)
+                            dry_run=args.dry_run,
+                            max_workers=args.workers,
+                            full=args.full)
 
         if not args.dry_run:
             print(f"\n✓ Downloaded emails to {output_dir}/raw_emails")
@@ -501,7 +853,7 @@ def main():
         print(f"Output directory: {output_dir}")
 
         # Convert emails to markdown
-        convert_emails_to_markdown(input_dir, output_dir)
+        convert_emails_to_markdown(input_dir, output_dir, max_workers=args.workers)
 
         print(f"\n✓ Converted emails saved to {output_dir}")
 
@@ -1,4 +1,5 @@
 import json
+from functools import cache
 
 import dspy
 from pydantic import BaseModel
@@ -41,13 +42,17 @@ class EssayConverter(dspy.Module):
         essay.PostTitle = title_pred.entry_title
         return essay
 
+@cache
+def _get_lm() -> dspy.LM:
+    # Built once on first use and shared by every convert() call (and thread),
+    # so the underlying client and its connections are reused
+    return dspy.LM("gemini/gemini-2.5-flash", temperature=1.0, max_tokens=64000, cache=False)
+
 def convert(text: str) -> Essay:
     # module = dspy.Predict(EssaySignature)
     module = EssayConverter()
 
-    lm = dspy.LM("gemini/gemini-2.5-flash", temperature=1.0, max_tokens=64000, cache=False)
-
-    with dspy.context(lm=lm):
+    with dspy.context(lm=_get_lm()):
         essay = module(text=text)
 
     return essay
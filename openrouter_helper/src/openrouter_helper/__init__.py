@@ -1,9 +1,14 @@
 """OpenRouter Helper - A Python library for querying OpenRouter models."""
 
+import importlib
+from typing import TYPE_CHECKING
+
 from .client import OpenRouterClient
-from .models import Model, ModelPricing, ModelArchitecture, TopProvider
+from .models import Model, ModelPricing, ModelArchitecture, TopProvider, ModelColumns
 from .query import ModelQuery
-from .nl_interface import NaturalLanguageQuery, QueryPlan
+
+if TYPE_CHECKING:
+    from .nl_interface import NaturalLanguageQuery, QueryPlan
 
 __version__ = "0.1.0"
 
@@ -13,7 +18,24 @@ __all__ = [
     "ModelPricing",
     "ModelArchitecture",
     "TopProvider",
+    "ModelColumns",
     "ModelQuery",
     "NaturalLanguageQuery",
     "QueryPlan",
 ]
+
+# The natural language interface pulls in DSPy (and litellm etc.), which is slow
+# to import, so it is only loaded on first access (PEP 562)
+_LAZY_IMPORTS = {
+    "NaturalLanguageQuery": ".nl_interface",
+    "QueryPlan": ".nl_interface",
+}
+
+
+def __getattr__(name: str):
+    if name in _LAZY_IMPORTS:
+        module = importlib.import_module(_LAZY_IMPORTS[name], __name__)
+        value = getattr(module, name)
+        globals()[name] = value
+        return value
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,28 +1,44 @@
 """OpenRouter API client."""
 
 import os
-from typing import List, Optional
+import time
+from typing import Dict, List, Optional
 import requests
-from .models import Model
+from pydantic import ValidationError
+from .models import Model, ModelColumns, ModelsResponse
 
 
 class OpenRouterClient:
     """Client for interacting with OpenRouter API."""
 
     BASE_URL = "https://openrouter.ai/api/v1"
+    DEFAULT_CACHE_TTL = 300.0
 
-    def __init__(self, api_key: Optional[str] = None):
+    def __init__(self, api_key: Optional[str] = None, cache_ttl: Optional[float] = DEFAULT_CACHE_TTL):
         """
         Initialize OpenRouter client.
 
         Args:
             api_key: OpenRouter API key. If not provided, reads from OPENROUTER_API_KEY env var.
+            cache_ttl: Seconds to reuse the fetched model catalog before refetching it.
+                None keeps it until refresh() is called.
         """
         self.api_key = api_key or os.getenv("OPENROUTER_API_KEY")
         if not self.api_key:
             # Allow initialization without key for public endpoints
             pass
 
+        # Reuse one keep-alive connection pool for all API calls
+        self._session = requests.Session()
+        self._session.headers.update(self._get_headers())
+
+        # Unfiltered model catalog, fetched lazily and reused across calls
+        self.cache_ttl = cache_ttl
+        self._models_cache: Optional[List[Model]] = None
+        self._models_by_id: Dict[str, Model] = {}
+        self._model_columns: Optional[ModelColumns] = None
+        self._models_fetched_at = 0.0
+
     def _get_headers(self) -> dict:
         """Get headers for API requests."""
         headers = {
@@ -36,20 +52,63 @@ class OpenRouterClient:
         """
         Fetch all available models from OpenRouter.
 
+        The unfiltered catalog is cached on the client for cache_ttl seconds;
+        use refresh() to force a refetch.
+
         Args:
             supported_parameters: Optional list of required parameters (e.g., ['temperature', 'top_p'])
 
         Returns:
             List of Model objects
         """
+        if supported_parameters:
+            return self._fetch_models(supported_parameters)
+
+        return list(self._cached_models())
+
+    def _cached_models(self) -> List[Model]:
+        """Return the cached catalog, refetching it if missing or expired."""
+        expired = (
+            self.cache_ttl is not None
+            and time.monotonic() - self._models_fetched_at >= self.cache_ttl
+        )
+        if self._models_cache is None or expired:
+            self._models_cache = self._fetch_models()
+            self._models_by_id = {model.id: model for model in self._models_cache}
+            self._model_columns = None
+            self._models_fetched_at = time.monotonic()
+
+        return self._models_cache
+
+    def get_model_columns(self) -> ModelColumns:
+        """
+        Get a column-oriented view of the cached model catalog.
+
+        Returns:
+            ModelColumns built from the same catalog get_models() returns
+        """
+        models = self._cached_models()
+        if self._model_columns is None:
+            self._model_columns = ModelColumns(models)
+        return self._model_columns
+
+    def _fetch_models(self, supported_parameters: Optional[List[str]] = None) -> List[Model]:
+        """Fetch and parse the model list from the OpenRouter API."""
         url = f"{self.BASE_URL}/models"
         params = {}
         if supported_parameters:
             params["supported_parameters"] = ",".join(supported_parameters)
 
-        response = requests.get(url, headers=self._get_headers(), params=params)
+        response = self._session.get(url, params=params)
         response.raise_for_status()
 
+        # Parse and validate the raw body in one pass inside pydantic-core
+        try:
+            return ModelsResponse.model_validate_json(response.content).data
+        except ValidationError:
+            pass
+
+        # Some entries are invalid: validate one by one and skip the bad ones
         data = response.json()
         models = []
 
@@ -74,8 +133,11 @@ class OpenRouterClient:
         Returns:
             Model object or None if not found
         """
-        models = self.get_models()
-        for model in models:
-            if model.id == model_id:
-                return model
-        return None
+        self._cached_models()
+        return self._models_by_id.get(model_id)
+
+    def refresh(self) -> None:
+        """Drop the cached model catalog so the next lookup refetches it."""
+        self._models_cache = None
+        self._models_by_id = {}
+        self._model_columns = None
@@ -1,12 +1,15 @@
 """Data models for OpenRouter API responses."""
 
-from typing import Optional, Dict, Any, List
-from pydantic import BaseModel, Field
+from bisect import bisect_left, bisect_right
+from typing import Optional, Dict, Any, List, Tuple
+from pydantic import BaseModel, ConfigDict, Field
 
 
 class ModelPricing(BaseModel):
     """Pricing information for a model."""
 
+    model_config = ConfigDict(frozen=True)
+
     prompt: float = Field(description="Cost per token for input (prompt), in USD")
     completion: float = Field(description="Cost per token for output (completion), in USD")
     request: Optional[float] = Field(default=None, description="Cost per request, in USD")
@@ -16,6 +19,8 @@ class ModelPricing(BaseModel):
 class ModelArchitecture(BaseModel):
     """Architecture information for a model."""
 
+    model_config = ConfigDict(frozen=True)
+
     modality: str = Field(description="Model modality (e.g., 'text', 'multimodal')")
     tokenizer: str = Field(description="Tokenizer used by the model")
     instruct_type: Optional[str] = Field(default=None, description="Instruction format type")
@@ -24,6 +29,8 @@ class ModelArchitecture(BaseModel):
 class TopProvider(BaseModel):
     """Information about the top provider for a model."""
 
+    model_config = ConfigDict(frozen=True)
+
     context_length: Optional[int] = Field(default=None, description="Maximum context length")
     max_completion_tokens: Optional[int] = Field(default=None, description="Maximum completion tokens")
     is_moderated: bool = Field(default=False, description="Whether the provider moderates content")
@@ -32,6 +39,8 @@ class TopProvider(BaseModel):
 class Model(BaseModel):
     """OpenRouter model information."""
 
+    model_config = ConfigDict(frozen=True)
+
     id: str = Field(description="Unique model identifier")
     name: str = Field(description="Human-readable model name")
     created: Optional[int] = Field(default=None, description="Creation timestamp")
@@ -51,3 +60,58 @@ class Model(BaseModel):
     def output_price_per_million(self) -> float:
         """Get output price per million tokens."""
         return self.pricing.completion * 1_000_000
+
+    @property
+    def name_lower(self) -> str:
+        """Get the lowercased model name for case-insensitive matching."""
+        return self.name.lower()
+
+    @property
+    def id_lower(self) -> str:
+        """Get the lowercased model ID for case-insensitive matching."""
+        return self.id.lower()
+
+
+class ModelsResponse(BaseModel):
+    """Response body of the OpenRouter /models endpoint."""
+
+    data: List[Model] = Field(default_factory=list, description="Available models")
+
+
+class ModelColumns:
+    """Column-oriented view of a model catalog, built once per catalog fetch.
+
+    Each attribute is a list aligned with ``models``, so filters can scan a
+    plain list of numbers or strings instead of reading attributes off every
+    Model.
+    """
+
+    def __init__(self, models: List[Model]):
+        self.models = models
+        self.input_price_per_million = [m.input_price_per_million for m in models]
+        self.output_price_per_million = [m.output_price_per_million for m in models]
+        self.context_length = [m.context_length for m in models]
+        self.name_lower = [m.name_lower for m in models]
+        self.id_lower = [m.id_lower for m in models]
+        self._sorted: Dict[str, Tuple[List[Any], List[int]]] = {}
+
+    def __len__(self) -> int:
+        return len(self.models)
+
+    def _sorted_column(self, column: str) -> Tuple[List[Any], List[int]]:
+        """Return (sorted values, row indices in that order) for a column, built lazily."""
+        if column not in self._sorted:
+            values = getattr(self, column)
+            rows = sorted(range(len(values)), key=values.__getitem__)
+            self._sorted[column] = ([values[i] for i in rows], rows)
+        return self._sorted[column]
+
+    def rows_less_than(self, column: str, value: Any) -> List[int]:
+        """Get indices of rows whose column value is < value, via binary search."""
+        values, rows = self._sorted_column(column)
+        return rows[:bisect_left(values, value)]
+
+    def rows_greater_than(self, column: str, value: Any) -> List[int]:
+        """Get indices of rows whose column value is > value, via binary search."""
+        values, rows = self._sorted_column(column)
+        return rows[bisect_right(values, value):]
@@ -1,7 +1,8 @@
 """Natural language interface for querying OpenRouter models using DSPy."""
 
 import os
-from typing import List, Optional
+from functools import lru_cache
+from typing import Dict, List, Optional, Tuple
 import dspy
 from pydantic import BaseModel, Field
 
@@ -60,6 +61,40 @@ class ModelQuerySignature(dspy.Signature):
     query_plan: QueryPlan = dspy.OutputField(desc="Structured query plan")
 
 
+class BatchModelQuerySignature(dspy.Signature):
+    """Parse several natural language queries about OpenRouter models into structured query plans.
+
+    Return exactly one query plan per input query, in the same order.
+    Interpret each query on its own, as in ModelQuerySignature.
+
+    Note: Prices are per million tokens unless otherwise specified.
+    """
+
+    natural_queries: List[str] = dspy.InputField(desc="Natural language queries about models")
+    query_plans: List[QueryPlan] = dspy.OutputField(desc="One structured query plan per query")
+
+
+@lru_cache(maxsize=8)
+def _get_predictor(lm_model: str, api_key: str) -> Tuple[dspy.LM, dspy.Predict, dspy.Predict]:
+    """
+    Get the shared DSPy LM and query predictors for a model and API key.
+
+    Built once per (lm_model, api_key) and reused by every NaturalLanguageQuery,
+    so new instances skip LM setup and predictor construction.
+
+    Returns:
+        (lm, predictor, batch_predictor) tuple
+    """
+    # DSPy LM with OpenRouter
+    lm = dspy.LM(
+        model=lm_model,
+        api_key=api_key,
+        api_base="https://openrouter.ai/api/v1",
+        temperature=0.0,  # Deterministic parsing
+    )
+    return lm, dspy.Predict(ModelQuerySignature), dspy.Predict(BatchModelQuerySignature)
+
+
 class NaturalLanguageQuery:
     """Natural language interface for querying OpenRouter models."""
 
@@ -89,17 +124,17 @@ class NaturalLanguageQuery:
                 "Set OPENROUTER_API_KEY environment variable or pass api_key parameter."
             )
 
-        # DSPy LM with OpenRouter
-        lm = dspy.LM(
-            model=lm_model,
-            api_key=api_key,
-            api_base="https://openrouter.ai/api/v1",
-            temperature=0.0,  # Deterministic parsing
-        )
-        dspy.configure(lm=lm)
+        # Shared LM and predictors; the LM is scoped per call with dspy.context
+        # rather than set globally, so instances with different models coexist
+        self.lm, self.predictor, self.batch_predictor = _get_predictor(lm_model, api_key)
+
+        # Parsed plans keyed by normalized query text, so repeats skip the LM
+        self._plan_cache: Dict[str, QueryPlan] = {}
 
-        # Create predictor
-        self.predictor = dspy.Predict(ModelQuerySignature)
+    @staticmethod
+    def _plan_cache_key(natural_query: str) -> str:
+        """Normalize a query so case and whitespace variants share a cache entry."""
+        return " ".join(natural_query.lower().split())
 
     def query(self, natural_query: str) -> List[Model]:
         """
@@ -116,10 +151,48 @@ class NaturalLanguageQuery:
             List of models matching the query
         """
         # Parse natural language to structured query
-        result = self.predictor(natural_query=natural_query)
-        plan: QueryPlan = result.query_plan
+        plan = self.get_query_plan(natural_query)
+
+        return self._run_plan(plan)
+
+    def query_many(self, natural_queries: List[str]) -> List[List[Model]]:
+        """
+        Execute several natural language queries with a single LM call.
+
+        Queries without a cached plan are parsed in one request, then each plan
+        is run against the client's cached model catalog.
+
+        Args:
+            natural_queries: Natural language query strings
+
+        Returns:
+            One list of matching models per query, in the same order
+        """
+        keys = [self._plan_cache_key(q) for q in natural_queries]
+
+        # Parse each distinct uncached query once
+        missing: Dict[str, str] = {}
+        for key, natural_query in zip(keys, natural_queries):
+            if key not in self._plan_cache:
+                missing.setdefault(key, natural_query)
+
+        if missing:
+            with dspy.context(lm=self.lm):
+                result = self.batch_predictor(natural_queries=list(missing.values()))
+            plans: List[QueryPlan] = result.query_plans
+
+            if len(plans) != len(missing):
+                raise ValueError(
+                    f"Expected {len(missing)} query plans from the language model, "
+                    f"got {len(plans)}"
+                )
+
+            self._plan_cache.update(zip(missing, plans))
+
+        return [self._run_plan(self._plan_cache[key]) for key in keys]
 
-        # Build query using structured plan
+    def _run_plan(self, plan: QueryPlan) -> List[Model]:
+        """Build and execute a ModelQuery from a structured query plan."""
         query = ModelQuery(client=self.client)
 
         if plan.input_price_max is not None:
@@ -150,6 +223,8 @@ class NaturalLanguageQuery:
         Parse a natural language query and return the structured query plan.
 
         Useful for debugging or understanding how the query was interpreted.
+        Plans are cached per instance, keyed by the query with case and
+        whitespace normalized.
 
         Args:
             natural_query: Natural language query string
@@ -157,5 +232,11 @@ class NaturalLanguageQuery:
         Returns:
             Structured query plan
         """
-        result = self.predictor(natural_query=natural_query)
-        return result.query_plan
+        key = self._plan_cache_key(natural_query)
+        plan = self._plan_cache.get(key)
+        if plan is None:
+            with dspy.context(lm=self.lm):
+                result = self.predictor(natural_query=natural_query)
+            plan = result.query_plan
+            self._plan_cache[key] = plan
+        return plan
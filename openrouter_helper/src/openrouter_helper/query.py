@@ -1,9 +1,75 @@
 """Query interface for filtering OpenRouter models."""
 
-from typing import List, Optional, Callable
-from .models import Model
+from functools import lru_cache
+from typing import Any, Callable, Iterable, Iterator, List, Optional, Sequence, Tuple
+from .models import Model, ModelColumns
 from .client import OpenRouterClient
 
+# A built-in filter: (ModelColumns attribute, operator, value). Operators are
+# "<", ">" and "contains" (value is lowercased when the filter is added).
+FilterSpec = Tuple[str, str, Any]
+
+# Operators each filterable ModelColumns attribute supports
+_FIELD_OPS = {
+    "input_price_per_million": ("<", ">"),
+    "output_price_per_million": ("<", ">"),
+    "context_length": ("<", ">"),
+    "name_lower": ("contains",),
+    "id_lower": ("contains",),
+}
+
+# Source template for each operator, given the column and value local names
+_OP_TEMPLATES = {
+    "<": "{col}[i] < {val}",
+    ">": "{col}[i] > {val}",
+    "contains": "{val} in {col}[i]",
+}
+
+# Catalog size from which numeric filters first narrow the scan with the
+# sorted-column index; below it a plain scan is cheaper than sorting rows
+_INDEX_MIN_ROWS = 2000
+
+
+@lru_cache(maxsize=128)
+def _compile_specs(
+    shape: Tuple[Tuple[str, str], ...]
+) -> Callable[[ModelColumns, Sequence[Any], Iterable[int]], Iterator[int]]:
+    """
+    Generate a single row-matching generator for a sequence of filter specs.
+
+    The generator takes the catalog columns, the spec values (in the same
+    order as shape) and the candidate row indices, and lazily yields the
+    candidates passing every spec. All columns and values are bound to plain
+    locals up front and the specs are joined into one short-circuiting
+    condition, so each row costs one pass with no per-filter closure calls.
+    Only the (column, op) shape is part of the cache key, so queries that
+    differ only in thresholds share the code.
+
+    Args:
+        shape: (column, op) pairs of the specs to compile
+
+    Returns:
+        Generator function of (columns, values, rows) yielding matching row indices
+    """
+    lines = ["def _match_rows(columns, values, rows):"]
+    conditions = []
+    for n, (column, op) in enumerate(shape):
+        if not column.isidentifier():
+            raise ValueError(f"Invalid filter column: {column!r}")
+        lines.append(f"    c{n} = columns.{column}")
+        lines.append(f"    v{n} = values[{n}]")
+        conditions.append(_OP_TEMPLATES[op].format(col=f"c{n}", val=f"v{n}"))
+
+    lines += [
+        "    for i in rows:",
+        f"        if {' and '.join(conditions) or 'True'}:",
+        "            yield i",
+    ]
+
+    namespace: dict = {}
+    exec("\n".join(lines), namespace)
+    return namespace["_match_rows"]
+
 
 class ModelQuery:
     """Query builder for filtering OpenRouter models."""
@@ -16,6 +82,7 @@ class ModelQuery:
             client: OpenRouter client. If not provided, creates a new one.
         """
         self.client = client or OpenRouterClient()
+        self._specs: List[FilterSpec] = []
         self._filters: List[Callable[[Model], bool]] = []
 
     def where_input_price_less_than(self, price: float) -> "ModelQuery":
@@ -28,8 +95,7 @@ class ModelQuery:
         Returns:
             Self for chaining
         """
-        self._filters.append(lambda m: m.input_price_per_million < price)
-        return self
+        return self._add("input_price_per_million", "<", price)
 
     def where_output_price_less_than(self, price: float) -> "ModelQuery":
         """
@@ -41,8 +107,7 @@ class ModelQuery:
         Returns:
             Self for chaining
         """
-        self._filters.append(lambda m: m.output_price_per_million < price)
-        return self
+        return self._add("output_price_per_million", "<", price)
 
     def where_input_price_greater_than(self, price: float) -> "ModelQuery":
         """
@@ -54,8 +119,7 @@ class ModelQuery:
         Returns:
             Self for chaining
         """
-        self._filters.append(lambda m: m.input_price_per_million > price)
-        return self
+        return self._add("input_price_per_million", ">", price)
 
     def where_output_price_greater_than(self, price: float) -> "ModelQuery":
         """
@@ -67,8 +131,7 @@ class ModelQuery:
         Returns:
             Self for chaining
         """
-        self._filters.append(lambda m: m.output_price_per_million > price)
-        return self
+        return self._add("output_price_per_million", ">", price)
 
     def where_context_length_greater_than(self, length: int) -> "ModelQuery":
         """
@@ -80,8 +143,7 @@ class ModelQuery:
         Returns:
             Self for chaining
         """
-        self._filters.append(lambda m: m.context_length > length)
-        return self
+        return self._add("context_length", ">", length)
 
     def where_name_contains(self, text: str) -> "ModelQuery":
         """
@@ -93,8 +155,7 @@ class ModelQuery:
         Returns:
             Self for chaining
         """
-        self._filters.append(lambda m: text.lower() in m.name.lower())
-        return self
+        return self._add("name_lower", "contains", text)
 
     def where_id_contains(self, text: str) -> "ModelQuery":
         """
@@ -106,7 +167,25 @@ class ModelQuery:
         Returns:
             Self for chaining
         """
-        self._filters.append(lambda m: text.lower() in m.id.lower())
+        return self._add("id_lower", "contains", text)
+
+    def _add(self, column: str, op: str, value: Any) -> "ModelQuery":
+        """
+        Add a built-in filter spec.
+
+        Args:
+            column: ModelColumns attribute to filter on
+            op: Operator supported for that column in _FIELD_OPS
+            value: Value to compare against
+
+        Returns:
+            Self for chaining
+        """
+        if op not in _FIELD_OPS.get(column, ()):
+            raise ValueError(f"Unsupported filter: {column} {op}")
+        if op == "contains":
+            value = value.lower()
+        self._specs.append((column, op, value))
         return self
 
     def where(self, filter_fn: Callable[[Model], bool]) -> "ModelQuery":
@@ -122,6 +201,65 @@ class ModelQuery:
         self._filters.append(filter_fn)
         return self
 
+    def _iter_filtered(self) -> Iterator[Model]:
+        """
+        Lazily yield models matching all filters, in catalog order.
+
+        Returns:
+            Iterator over matching models
+        """
+        columns = self.client.get_model_columns()
+
+        # Numeric comparisons go before the costlier substring checks
+        specs = sorted(self._specs, key=lambda spec: spec[1] == "contains")
+        match_rows = _compile_specs(tuple((column, op) for column, op, _ in specs))
+        rows = self._candidate_rows(columns)
+
+        # Row-to-model lookup runs in C via map; without custom filters there
+        # is no per-row Python code left outside the compiled matcher
+        matches = map(
+            columns.models.__getitem__,
+            match_rows(columns, [value for _, _, value in specs], rows),
+        )
+        filters = self._filters
+        if not filters:
+            return matches
+
+        # Custom filters only see models that passed every built-in filter
+        return (model for model in matches if all(f(model) for f in filters))
+
+    def _candidate_rows(self, columns: ModelColumns) -> Iterable[int]:
+        """
+        Get the row indices worth checking against the filters.
+
+        For large catalogs, each numeric spec is turned into a range of its
+        sorted column by binary search and the narrowest range is used, in
+        catalog order. The compiled matcher still checks every spec.
+
+        Args:
+            columns: Catalog columns being queried
+
+        Returns:
+            Candidate row indices in catalog order
+        """
+        if len(columns) < _INDEX_MIN_ROWS:
+            return range(len(columns))
+
+        narrowest: Optional[List[int]] = None
+        for column, op, value in self._specs:
+            if op == "<":
+                rows = columns.rows_less_than(column, value)
+            elif op == ">":
+                rows = columns.rows_greater_than(column, value)
+            else:
+                continue
+            if narrowest is None or len(rows) < len(narrowest):
+                narrowest = rows
+
+        if narrowest is None:
+            return range(len(columns))
+        return sorted(narrowest)
+
     def list_models(self) -> List[Model]:
         """
         Execute the query and return filtered models.
@@ -129,12 +267,7 @@ class ModelQuery:
         Returns:
             List of models matching all filters
         """
-        models = self.client.get_models()
-
-        for filter_fn in self._filters:
-            models = [m for m in models if filter_fn(m)]
-
-        return models
+        return list(self._iter_filtered())
 
     def count(self) -> int:
         """
@@ -143,14 +276,15 @@ class ModelQuery:
         Returns:
             Number of matching models
         """
-        return len(self.list_models())
+        return sum(1 for _ in self._iter_filtered())
 
     def first(self) -> Optional[Model]:
         """
         Get the first model matching the filters.
 
+        Stops scanning the catalog at the first match.
+
         Returns:
             First matching model or None
         """
-        models = self.list_models()
-        return models[0] if models else None
+        return next(self._iter_filtered(), None)
@@ -1,8 +1,21 @@
 """Basic tests for openrouter_helper."""
 
+import subprocess
+import sys
+from types import SimpleNamespace
+
 import pytest
-from openrouter_helper import Model, ModelPricing, ModelQuery
+from pydantic import ValidationError
+from openrouter_helper import Model, ModelColumns, ModelPricing, ModelQuery
 from openrouter_helper.client import OpenRouterClient
+from openrouter_helper import query as query_module
+from openrouter_helper.models import ModelsResponse
+
+
+def _make_model(**kw):
+    """Build a Model fixture without running validation."""
+    pricing = ModelPricing.model_construct(**kw.pop("pricing"))
+    return Model.model_construct(pricing=pricing, **kw)
 
 
 def test_model_pricing():
@@ -33,17 +46,17 @@ def test_model_query_filters():
     """Test ModelQuery filter building."""
     # Create mock models
     models_data = [
-        Model(
+        _make_model(
             id="cheap/model",
             name="Cheap Model",
             context_length=8192,
-            pricing=ModelPricing(prompt=0.0000001, completion=0.0000002)
+            pricing={"prompt": 0.0000001, "completion": 0.0000002}
         ),
-        Model(
+        _make_model(
             id="expensive/model",
             name="Expensive Model",
             context_length=128000,
-            pricing=ModelPricing(prompt=0.000005, completion=0.000015)
+            pricing={"prompt": 0.000005, "completion": 0.000015}
         ),
     ]
 
@@ -63,17 +76,17 @@ def test_model_query_filters():
 def test_context_length_filter():
     """Test context length filtering."""
     models_data = [
-        Model(
+        _make_model(
             id="small/model",
             name="Small Model",
             context_length=8192,
-            pricing=ModelPricing(prompt=0.0000001, completion=0.0000002)
+            pricing={"prompt": 0.0000001, "completion": 0.0000002}
         ),
-        Model(
+        _make_model(
             id="large/model",
             name="Large Model",
             context_length=128000,
-            pricing=ModelPricing(prompt=0.000005, completion=0.000015)
+            pricing={"prompt": 0.000005, "completion": 0.000015}
         ),
     ]
 
@@ -87,17 +100,17 @@ def test_context_length_filter():
 def test_name_search():
     """Test name-based searching."""
     models_data = [
-        Model(
+        _make_model(
             id="openai/gpt-4",
             name="GPT-4",
             context_length=8192,
-            pricing=ModelPricing(prompt=0.000005, completion=0.000015)
+            pricing={"prompt": 0.000005, "completion": 0.000015}
         ),
-        Model(
+        _make_model(
             id="anthropic/claude-3",
             name="Claude 3",
             context_length=200000,
-            pricing=ModelPricing(prompt=0.000003, completion=0.000015)
+            pricing={"prompt": 0.000003, "completion": 0.000015}
         ),
     ]
 
@@ -111,3 +124,280 @@ def test_name_search():
     assert gpt_models[0].id == "openai/gpt-4"
     assert len(claude_models) == 1
     assert claude_models[0].id == "anthropic/claude-3"
+
+
+def test_client_caches_models(monkeypatch):
+    """Test that the model catalog is fetched once and indexed by ID."""
+    models_data = [
+        _make_model(
+            id="openai/gpt-4",
+            name="GPT-4",
+            context_length=8192,
+            pricing={"prompt": 0.000005, "completion": 0.000015}
+        ),
+        _make_model(
+            id="anthropic/claude-3",
+            name="Claude 3",
+            context_length=200000,
+            pricing={"prompt": 0.000003, "completion": 0.000015}
+        ),
+    ]
+    fetches = []
+
+    def fake_fetch(supported_parameters=None):
+        fetches.append(supported_parameters)
+        return models_data
+
+    client = OpenRouterClient(api_key="test-key")
+    monkeypatch.setattr(client, "_fetch_models", fake_fetch)
+
+    assert client.get_model("anthropic/claude-3").name == "Claude 3"
+    assert client.get_model("missing/model") is None
+    assert len(client.get_models()) == 2
+    assert len(fetches) == 1
+
+    client.refresh()
+    client.get_models()
+    assert len(fetches) == 2
+
+
+class _StaticClient:
+    """Client stand-in that serves a fixed model list."""
+
+    def __init__(self, models):
+        self.models = models
+
+    def get_models(self):
+        return list(self.models)
+
+    def get_model_columns(self):
+        return ModelColumns(self.models)
+
+
+def _catalog_client():
+    """Build a client serving a small mixed catalog."""
+    return _StaticClient([
+        _make_model(
+            id="openai/gpt-4o-mini",
+            name="GPT-4o mini",
+            context_length=128000,
+            pricing={"prompt": 0.00000015, "completion": 0.0000006}
+        ),
+        _make_model(
+            id="openai/gpt-4",
+            name="GPT-4",
+            context_length=8192,
+            pricing={"prompt": 0.00003, "completion": 0.00006}
+        ),
+        _make_model(
+            id="anthropic/claude-3-haiku",
+            name="Claude 3 Haiku",
+            context_length=200000,
+            pricing={"prompt": 0.00000025, "completion": 0.00000125}
+        ),
+    ])
+
+
+def test_model_query_chained_filters():
+    """Test that chained ModelQuery filters are all applied."""
+    client = _catalog_client()
+
+    query = (
+        ModelQuery(client=client)
+        .where_input_price_less_than(1.0)
+        .where_context_length_greater_than(100000)
+        .where_name_contains("gpt")
+    )
+
+    assert [m.id for m in query.list_models()] == ["openai/gpt-4o-mini"]
+    assert query.count() == 1
+    assert query.first().id == "openai/gpt-4o-mini"
+    assert ModelQuery(client=client).where_id_contains("mistral").first() is None
+
+
+def test_client_cache_ttl(monkeypatch):
+    """Test that an expired model catalog is refetched."""
+    fetches = []
+
+    def fake_fetch(supported_parameters=None):
+        fetches.append(supported_parameters)
+        return []
+
+    client = OpenRouterClient(api_key="test-key", cache_ttl=0)
+    monkeypatch.setattr(client, "_fetch_models", fake_fetch)
+
+    client.get_models()
+    client.get_models()
+    assert len(fetches) == 2
+
+
+def test_model_query_runs_cheap_filters_first():
+    """Test that custom filters only see models passing built-in filters."""
+    seen = []
+    query = (
+        ModelQuery(client=_catalog_client())
+        .where(lambda m: seen.append(m.id) or True)
+        .where_context_length_greater_than(100000)
+    )
+
+    assert query.count() == 2
+    assert seen == ["openai/gpt-4o-mini", "anthropic/claude-3-haiku"]
+
+
+def test_model_copy_updates_derived_fields():
+    """Test that derived fields follow fields changed by model_copy."""
+    model = Model(
+        id="test/model",
+        name="Test Model",
+        context_length=8192,
+        pricing=ModelPricing(prompt=0.0000005, completion=0.0000015)
+    )
+
+    assert model.input_price_per_million == 0.5
+    updated = model.model_copy(
+        update={"pricing": ModelPricing(prompt=0.000005, completion=0.000015)}
+    )
+    assert updated.input_price_per_million == pytest.approx(5.0)
+    assert updated.output_price_per_million == pytest.approx(15.0)
+    assert updated == model.model_copy(update={"pricing": updated.pricing})
+    assert "input_price_per_million" not in model.model_dump()
+    assert model.name_lower == "test model"
+    assert model.model_copy(update={"name": "Renamed"}).name_lower == "renamed"
+    assert model.id_lower == "test/model"
+
+
+def test_models_response_parsing():
+    """Test parsing a /models response body, including string prices."""
+    body = (
+        b'{"data": [{"id": "openai/gpt-4", "name": "GPT-4", "context_length": 8192,'
+        b' "pricing": {"prompt": "0.00003", "completion": "0.00006"},'
+        b' "canonical_slug": "openai/gpt-4"}]}'
+    )
+
+    models = ModelsResponse.model_validate_json(body).data
+
+    assert len(models) == 1
+    assert models[0].id == "openai/gpt-4"
+    assert models[0].input_price_per_million == 30.0
+
+
+def test_catalog_models_are_frozen():
+    """Test that catalog models are read-only."""
+    model = Model(
+        id="test/model",
+        name="Test Model",
+        context_length=8192,
+        pricing=ModelPricing(prompt=0.0000005, completion=0.0000015)
+    )
+
+    with pytest.raises(ValidationError):
+        model.pricing.prompt = 1.0
+    assert model.input_price_per_million == 0.5
+
+
+def test_model_query_price_range():
+    """Test combining lower and upper price bounds."""
+    client = _catalog_client()
+
+    mid_priced = (
+        ModelQuery(client=client)
+        .where_input_price_greater_than(0.2)
+        .where_input_price_less_than(1.0)
+        .list_models()
+    )
+    cheap = ModelQuery(client=client).where_output_price_less_than(1.0).list_models()
+
+    assert [m.id for m in mid_priced] == ["anthropic/claude-3-haiku"]
+    assert [m.id for m in cheap] == ["openai/gpt-4o-mini"]
+
+
+def test_import_does_not_load_dspy():
+    """Test that importing the package defers the DSPy import."""
+    code = "import sys, openrouter_helper; assert 'dspy' not in sys.modules"
+    subprocess.run([sys.executable, "-c", code], check=True)
+
+
+def test_model_query_first_stops_at_first_match():
+    """Test that first() does not evaluate filters past the first match."""
+    seen = []
+    query = ModelQuery(client=_catalog_client()).where(lambda m: seen.append(m.id) or True)
+
+    assert query.first().id == "openai/gpt-4o-mini"
+    assert seen == ["openai/gpt-4o-mini"]
+
+
+def test_model_query_uses_sorted_index(monkeypatch):
+    """Test that index-narrowed queries match a plain scan."""
+    client = _catalog_client()
+    build = lambda: (
+        ModelQuery(client=client)
+        .where_input_price_less_than(1.0)
+        .where_context_length_greater_than(100000)
+    )
+    expected = [m.id for m in build().list_models()]
+
+    monkeypatch.setattr(query_module, "_INDEX_MIN_ROWS", 0)
+
+    assert [m.id for m in build().list_models()] == expected
+    assert expected == ["openai/gpt-4o-mini", "anthropic/claude-3-haiku"]
+    assert ModelColumns(client.models).rows_greater_than("context_length", 100000) == [0, 2]
+
+
+def _nl_query():
+    """Build a NaturalLanguageQuery over the test catalog, for stubbing its predictors."""
+    pytest.importorskip("dspy")
+    from openrouter_helper import NaturalLanguageQuery
+
+    return NaturalLanguageQuery(client=_catalog_client(), api_key="test-key")
+
+
+def test_query_many_parses_each_distinct_query_once():
+    """Test that query_many sends each normalized query to the LM once, in order."""
+    nlq = _nl_query()
+    from openrouter_helper import QueryPlan
+
+    plans = {
+        "cheap models": QueryPlan(input_price_max=1.0),
+        "long context": QueryPlan(context_length_min=150000),
+    }
+    calls = []
+
+    def batch_predictor(natural_queries):
+        calls.append(natural_queries)
+        return SimpleNamespace(query_plans=[plans[q] for q in natural_queries])
+
+    nlq.batch_predictor = batch_predictor
+
+    results = nlq.query_many(["long context", "cheap models", " Long  Context", "LONG context"])
+
+    assert calls == [["long context", "cheap models"]]
+    assert [[m.id for m in models] for models in results] == [
+        ["anthropic/claude-3-haiku"],
+        ["openai/gpt-4o-mini", "anthropic/claude-3-haiku"],
+        ["anthropic/claude-3-haiku"],
+        ["anthropic/claude-3-haiku"],
+    ]
+
+    nlq.batch_predictor = lambda natural_queries: SimpleNamespace(query_plans=[])
+    with pytest.raises(ValueError):
+        nlq.query_many(["gpt models"])
+
+
+def test_query_plans_are_cached_per_normalized_query():
+    """Test that case and whitespace variants of a query share one parsed plan."""
+    nlq = _nl_query()
+    from openrouter_helper import QueryPlan
+
+    calls = []
+
+    def predictor(natural_query):
+        calls.append(natural_query)
+        return SimpleNamespace(query_plan=QueryPlan(input_price_max=1.0, name_contains="gpt"))
+
+    nlq.predictor = predictor
+
+    first = nlq.query("cheap GPT models")
+    second = nlq.query("cheap  gpt models")
+
+    assert calls == ["cheap GPT models"]
+    assert [m.id for m in first] == [m.id for m in second] == ["openai/gpt-4o-mini"]